@@ -1,7 +1,41 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from typing import Dict, Any
 
-class BaseActuator(ABC):
+class _FastAbstractMeta(type):
+    """
+    A lightweight replacement for ABCMeta.
+    It only computes __abstractmethods__ when the class is created, so
+    CPython still refuses to instantiate incomplete classes, while
+    isinstance()/issubclass() fall back to the fast builtin C checks
+    instead of going through the ABC registry and its caches.
+
+    Note: there is no register()/__subclasshook__ here on purpose. Checks
+    such as isinstance(config_value, BaseActuator) on ints, strings or
+    dicts are rejected by the plain MRO walk without caching anything.
+    """
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, **kwargs: Any) -> '_FastAbstractMeta':
+        # Class keywords (e.g. class S(Base, model="x")) go on to __init_subclass__
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        # Methods marked with @abstractmethod directly in this class
+        abstracts = {
+            attr for attr, value in namespace.items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+
+        # Inherited abstract methods that were NOT overridden by this class
+        for base in bases:
+            for attr in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, attr, None), "__isabstractmethod__", False):
+                    abstracts.add(attr)
+
+        # Setting this attribute flags the type as abstract at the C level,
+        # so object.__new__ raises TypeError exactly like ABCMeta does.
+        cls.__abstractmethods__ = frozenset(abstracts)
+        return cls
+
+
+class BaseActuator(metaclass=_FastAbstractMeta):
     """
     An Abstract Base Class defines a strict contract.
     It cannot be instantiated directly. Any subclass MUST implement
@@ -2,25 +2,83 @@ import asyncio
 import time
 from typing import List, AsyncGenerator, Dict, Any
 
+try:
+    import uvloop # Optional: pip install uvloop (libuv-backed event loop)
+except ImportError:
+    uvloop = None
+
 # We limit the system to process a maximum of 3 concurrent network requests.
 # If 10 tasks are created, 3 will run, and 7 will wait in line.
 MAX_CONCURRENT_CONNECTIONS = 3
-network_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTIONS)
+
+
+class DynamicAdmission:
+    """
+    A resizable replacement for asyncio.Semaphore.
+    An explicit counter guarded by an asyncio.Condition decides how many
+    tasks may run at once, so the limit can be tuned safely at runtime
+    (e.g., to apply backpressure when the network degrades).
+    """
+    def __init__(self, limit: int):
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self._limit = limit
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            try:
+                await self._cond.wait_for(lambda: self._active < self._limit)
+            except asyncio.CancelledError:
+                # If this task was the one woken by release(), that wakeup would be
+                # lost with it (Condition only fixes this on 3.13+): pass it on.
+                if self._active < self._limit:
+                    self._cond.notify(1)
+                raise
+            self._active += 1
+
+    async def release(self) -> None:
+        # The slot is given back before any await: cancelling this task while
+        # it waits for the lock below must not leak it.
+        self._active -= 1
+        # Shielded, so the wakeup still reaches a waiter if we are cancelled
+        await asyncio.shield(self._notify_one())
+
+    async def _notify_one(self) -> None:
+        async with self._cond:
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Changes the concurrency limit. Growing it wakes up all waiting tasks."""
+        async with self._cond:
+            grew = limit > self._limit
+            self._limit = limit
+            if grew:
+                self._cond.notify_all()
+
+    async def __aenter__(self) -> 'DynamicAdmission':
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.release()
+
+
+network_admission = DynamicAdmission(MAX_CONCURRENT_CONNECTIONS)
 
 async def fetch_sensor_data_over_network(sensor_id: int, delay: float) -> Dict[str, Any]:
     """
     Simulates a network-bound I/O operation.
-    The 'async with' ensures the task waits for a green light from the semaphore.
+    The 'async with' ensures the task waits for a green light from the admission gate.
     """
-    async with network_semaphore:
-        print(f"[NETWORK] Sensor {sensor_id} connecting... (Semaphore acquired)")
+    async with network_admission:
+        print(f"[NETWORK] Sensor {sensor_id} connecting... (Slot acquired)")
         
         # CRITICAL: We use asyncio.sleep(), NOT time.sleep()!
         # time.sleep() would freeze the entire program. 
         # asyncio.sleep() pauses ONLY this function and hands control back to the Event Loop.
         await asyncio.sleep(delay) 
         
-        print(f"[NETWORK] Sensor {sensor_id} finished downloading. (Semaphore released)")
+        print(f"[NETWORK] Sensor {sensor_id} finished downloading. (Slot released)")
         return {"sensor_id": sensor_id, "payload": delay * 100.0}
 
 
@@ -49,7 +107,12 @@ async def consume_live_stream() -> None:
 
 
 async def main() -> None:
-    start_time = time.perf_counter()    
+    # Python 3.12+: eager tasks run synchronously up to their first real 'await',
+    # skipping one trip through the event loop for every create_task() call.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    start_ns = time.perf_counter_ns()
     tasks: List[asyncio.Task] = []
     
     for i in range(1, 9):
@@ -63,7 +126,7 @@ async def main() -> None:
     # It returns a list of results in the exact order the tasks were created.
     results = await asyncio.gather(*tasks)
     
-    elapsed_time = time.perf_counter() - start_time
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
     print(f"\n[SYSTEM] All {len(results)} requests completed in {elapsed_time:.2f} seconds.")
     print(f"[SYSTEM] Data Extracted: {results}")
 
@@ -74,4 +137,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is a drop-in C replacement for the default event loop.
+    # Falls back to the standard asyncio loop when it is not installed.
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
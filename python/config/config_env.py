@@ -15,6 +15,14 @@ class EnvConfigManager:
         
         dotenv.load_dotenv(self.filepath)
 
+        # Snapshot the secrets once. load_dotenv() never overrides variables that
+        # already exist in the OS, so reading them back from os.environ keeps that priority.
+        self._cache: Dict[str, str] = {
+            key: os.environ[key]
+            for key in dotenv.dotenv_values(self.filepath)
+            if key in os.environ
+        }
+
     def _ensure_exists(self) -> None:
         if not self.filepath.exists():
             print(f"[ENV] Secret file not found. Creating default at '{self.filepath}'")
@@ -27,8 +35,14 @@ class EnvConfigManager:
                 file.write(f"{key}={value}\n")
 
     def get_secret(self, key: str) -> str:
-        """Retrieves the secret directly from the loaded OS environment."""
-        return os.getenv(key, "NOT_FOUND")
+        """
+        Retrieves the secret from the in-memory snapshot.
+        Falls back to the OS environment only for keys not declared in the .env file.
+        """
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        return os.environ.get(key, "NOT_FOUND")
 
 if __name__ == "__main__":
     # Use empty or dummy strings for defaults. NEVER hardcode real passwords here.
@@ -39,5 +53,5 @@ if __name__ == "__main__":
 
     env_manager = EnvConfigManager("CONFIG/.env", DEFAULT_SECRETS)
     
-    api_key = os.getenv("OPENROUTER_API_KEY", "NOT_FOUND")
+    api_key = env_manager.get_secret("OPENROUTER_API_KEY")
     print(f"Loaded API Key: {api_key}")
\ No newline at end of file
@@ -1,8 +1,14 @@
 import json
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import orjson # Optional: pip install orjson (C-accelerated JSON)
+except ImportError:
+    orjson = None
 
 class JsonConfigManager:
     """Manages a JSON configuration file with automatic backups."""
@@ -12,6 +18,11 @@ class JsonConfigManager:
         self.filepath.parent.mkdir(parents=True, exist_ok=True) # Ensure directory exists
         
         self.default_config = default_config
+
+        # Parsed content + the file's modification time (ns) when it was parsed
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_mtime = -1
+
         self._ensure_exists()
 
     def _ensure_exists(self) -> None:
@@ -33,7 +44,26 @@ class JsonConfigManager:
         print(f"[JSON] Backup created: {backup_name}")
 
     def load(self) -> Dict[str, Any]:
-        """Reads and returns the JSON configuration."""
+        """
+        Returns the JSON configuration.
+        The file is only parsed again when its modification time changes.
+        The returned dict is shared between calls, so persist any change with update_all().
+        """
+        mtime = self.filepath.stat().st_mtime_ns
+        if self._cached is not None and mtime == self._cached_mtime:
+            return self._cached
+
+        self._cached = self._read_file()
+        self._cached_mtime = mtime
+        return self._cached
+
+    def _read_file(self) -> Dict[str, Any]:
+        """Reads and parses the JSON file from disk."""
+        if orjson is not None:
+            # orjson works directly on bytes, skipping the text decoding layer
+            with open(self.filepath, 'rb') as file:
+                return orjson.loads(file.read())
+
         with open(self.filepath, 'r', encoding='utf-8') as file:
             return json.load(file)
 
@@ -42,10 +72,31 @@ class JsonConfigManager:
         if create_backup and self.filepath.exists():
             self._create_backup()
             
-        with open(self.filepath, 'w', encoding='utf-8') as file:
-            json.dump(new_config, file, indent=4, sort_keys=True)
+        # Serialize before touching the file, then swap the new file in with a
+        # single rename: a value that can't be encoded never leaves it empty
+        payload = self._serialize(new_config)
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, self.filepath)
+
+        # The file on disk changed: force the next load() to parse it again
+        self._cached = None
         print(f"[JSON] Configuration saved successfully to '{self.filepath.name}'.")
 
+    def _serialize(self, config: Dict[str, Any]) -> bytes:
+        """Encodes the configuration as indented JSON with sorted keys."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass # e.g. integers beyond 64 bits: the stdlib encoder handles them
+
+        # Same layout as orjson (2 spaces, sorted keys, non-string keys written
+        # as strings), so the file doesn't change shape depending on which
+        # library is installed
+        return json.dumps(config, indent=2, sort_keys=True).encode('utf-8')
+
     def update_key(self, key: str, value: Any) -> None:
         """Updates a single key in real-time."""
         config = self.load()
@@ -2,7 +2,14 @@ import yaml # Requires: pip install pyyaml
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# The C bindings (libyaml) are much faster than the pure-Python implementation,
+# but only exist when PyYAML was built against libyaml. Fall back otherwise.
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 class YamlConfigManager:
     """Manages a YAML configuration file with automatic backups."""
@@ -12,6 +19,11 @@ class YamlConfigManager:
         self.filepath.parent.mkdir(parents=True, exist_ok=True) # Ensure directory exists
         
         self.default_config = default_config
+
+        # Parsed content + the file's modification time (ns) when it was parsed
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_mtime = -1
+
         self._ensure_exists()
 
     def _ensure_exists(self) -> None:
@@ -27,9 +39,23 @@ class YamlConfigManager:
         print(f"[YAML] Backup created: {backup_name}")
 
     def load(self) -> Dict[str, Any]:
+        """
+        Returns the YAML configuration.
+        The file is only parsed again when its modification time changes.
+        The returned dict is shared between calls, so persist any change with update_all().
+        """
+        mtime = self.filepath.stat().st_mtime_ns
+        if self._cached is not None and mtime == self._cached_mtime:
+            return self._cached
+
+        self._cached = self._read_file()
+        self._cached_mtime = mtime
+        return self._cached
+
+    def _read_file(self) -> Dict[str, Any]:
         with open(self.filepath, 'r', encoding='utf-8') as file:
-            # Safe load prevents arbitrary Python code execution from YAML files
-            return yaml.safe_load(file) or {}
+            # The Safe loader prevents arbitrary Python code execution from YAML files
+            return yaml.load(file, Loader=_SafeLoader) or {}
 
     def update_all(self, new_config: Dict[str, Any], create_backup: bool = True) -> None:
         if create_backup and self.filepath.exists():
@@ -37,7 +63,10 @@ class YamlConfigManager:
             
         with open(self.filepath, 'w', encoding='utf-8') as file:
             # default_flow_style=False ensures the clean block-style YAML format
-            yaml.dump(new_config, file, default_flow_style=False, sort_keys=False)
+            yaml.dump(new_config, file, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+        # The file on disk changed: force the next load() to parse it again
+        self._cached = None
         print(f"[YAML] Configuration saved successfully to '{self.filepath.name}'.")
 
 
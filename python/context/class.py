@@ -1,4 +1,4 @@
-from typing import Type, Optional
+from typing import Callable, ClassVar, Dict, Type, Optional
 from types import TracebackType
 
 
@@ -7,6 +7,8 @@ class RobotConnection:
     Manages a TCP/IP connection to an industrial robot arm.
     Ensures the device is safely locked during use and released afterward.
     """
+    __slots__ = ("ip_address", "is_connected")
+
     def __init__(self, ip_address: str):
         self.ip_address = ip_address
         self.is_connected = False
@@ -26,9 +28,19 @@ class RobotConnection:
         
         print(f" -> Executing: {command}")
         
+        # A single hash lookup, no matter how many special commands exist
+        handler = self._COMMAND_HANDLERS.get(command)
+        if handler is not None:
+            handler(self)
+
+    def _handle_force_overload(self) -> None:
         # Simulating a hardware fault during execution
-        if command == "FORCE_OVERLOAD":
-            raise RuntimeError("Hardware overload detected in joint 3!")
+        raise RuntimeError("Hardware overload detected in joint 3!")
+
+    # Command dispatch table: Command -> Handler. New commands only need a new entry.
+    _COMMAND_HANDLERS: ClassVar[Dict[str, Callable[['RobotConnection'], None]]] = {
+        "FORCE_OVERLOAD": _handle_force_overload,
+    }
 
     def __exit__(
         self, 
@@ -1,8 +1,9 @@
 from contextlib import ExitStack
-from typing import List, Any
+from typing import List, Any, ContextManager
 
 class HardwareRelay:
     """Represents a physical GPIO relay that must be turned off after use."""
+    __slots__ = ("pin_number",)
 
     def __init__(self, pin_number: int):
         self.pin_number = pin_number
@@ -17,18 +18,42 @@ class HardwareRelay:
 
 def activate_multiple_relays(pins: List[int]) -> None:
     """
-    Uses ExitStack to dynamically open a variable number of context managers.
-    Replaces the need for deeply nested 'with' statements.
+    Opens a variable number of relays without deeply nested 'with' statements.
+    All the context managers are the same simple type (HardwareRelay never
+    suppresses or raises in __exit__), so a plain list with LIFO teardown
+    does the job of ExitStack without its per-context callback machinery.
     """
+    entered: List[HardwareRelay] = []
 
-    with ExitStack() as stack:
+    try:
         for pin in pins:
-            stack.enter_context(HardwareRelay(pin))
+            relay = HardwareRelay(pin)
+            relay.__enter__()
+            entered.append(relay)
             
         print(f"\n[SYSTEM] Successfully initialized {len(pins)} relays simultaneously.")
         print("[SYSTEM] Performing coordinated operations...")
+    finally:
+        # Only the relays that were actually energized are released, in reverse order
+        for relay in reversed(entered):
+            relay.__exit__(None, None, None)
+
+
+def activate_multiple_devices(devices: List[ContextManager[Any]]) -> None:
+    """
+    Uses ExitStack to dynamically open a variable number of context managers.
+    Preferred for heterogeneous devices, where any __exit__ may suppress or
+    raise exceptions and ExitStack's exception chaining is needed.
+    """
+
+    with ExitStack() as stack:
+        for device in devices:
+            stack.enter_context(device)
+            
+        print(f"\n[SYSTEM] Successfully initialized {len(devices)} devices simultaneously.")
 
 
 if __name__ == "__main__":    
     relay_pins = [12, 14, 27]
-    activate_multiple_relays(relay_pins)
\ No newline at end of file
+    activate_multiple_relays(relay_pins)
+    activate_multiple_devices([HardwareRelay(pin) for pin in (32, 33)])
\ No newline at end of file
@@ -1,14 +1,19 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Dict
 import time
+import hashlib
 
-@dataclass(frozen=True)
+import numpy as np # Requires: pip install numpy
+
+@dataclass(frozen=True, slots=True)
 class TelemetryPacket:
     """
     A strictly immutable data structure.
     Once instantiated, its attributes cannot be modified.
     This is critical for thread safety and generating hashable objects 
     (meaning this object can be used as a dictionary key).
+    slots=True drops the per-instance __dict__, making each packet smaller
+    and its attribute reads faster (important for high-rate telemetry).
     """
     sensor_id: str
     temperature: float
@@ -27,8 +32,22 @@ class TelemetryPacket:
             # (which breaks the frozen contract and should be avoided).
             raise ValueError(f"Invalid temperature: {self.temperature}. Cannot be below absolute zero.")
 
+    @classmethod
+    def from_trusted(cls, sensor_id: str, temperature: float, timestamp: float) -> "TelemetryPacket":
+        """
+        Fast constructor for trusted bulk-ingest paths (e.g., already validated sensor farms).
+        Skips the generated __init__ and __post_init__ entirely.
+        The CALLER guarantees that temperature >= -273.15. Use the normal constructor otherwise.
+        """
+        packet = object.__new__(cls)
+        # object.__setattr__ bypasses the frozen guard, just like the generated __init__ does
+        object.__setattr__(packet, "sensor_id", sensor_id)
+        object.__setattr__(packet, "temperature", temperature)
+        object.__setattr__(packet, "timestamp", timestamp)
+        return packet
 
-@dataclass
+
+@dataclass(slots=True)
 class IndustrialRobotState:
     """
     Manages the state of a multi-axis robot.
@@ -38,12 +57,15 @@ class IndustrialRobotState:
     
     # DANGER: Never do `joint_angles: List[float] = []`. 
     # All instances would share the exact same list in memory!
-    # SOLUTION: Use default_factory to create a fresh list for each new object.
-    joint_angles: List[float] = field(default_factory=list)
+    # SOLUTION: Use default_factory to create a fresh object for each new instance.
+    # The angles are stored as a contiguous float32 NumPy array (4 bytes per angle
+    # instead of a boxed 28-byte Python float), ready for vectorized kinematics.
+    # Plain lists are still accepted and converted in __post_init__.
+    joint_angles: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
     
     # Internal variables that we don't want to pass in the constructor (init=False)
     # and we don't want to clutter the print output (repr=False)
-    _kinematics_hash: str = field(default="", init=False, repr=False)
+    _kinematics_hash: int = field(default=0, init=False, repr=False)
     
     def __post_init__(self) -> None:
         """
@@ -51,19 +73,35 @@ class IndustrialRobotState:
         """
         print(f"[SYSTEM] Initializing robot state for {self.axis_count} axes...")
         
+        # No copy is made if an array with the right dtype was passed in
+        self.joint_angles = np.asarray(self.joint_angles, dtype=np.float32)
+
         # If no angles were provided, initialize them to zero based on axis_count
-        if not self.joint_angles:
-            self.joint_angles = [0.0] * self.axis_count
+        if self.joint_angles.size == 0:
+            self.joint_angles = np.zeros(self.axis_count, dtype=np.float32)
             
-        # Strict architecture validation
-        if len(self.joint_angles) != self.axis_count:
+        # Strict architecture validation: exactly one flat row of angles
+        if self.joint_angles.shape != (self.axis_count,):
             raise ValueError(
                 f"Mismatch: Expected {self.axis_count} joint angles, "
-                f"but got {len(self.joint_angles)}."
+                f"but got an array of shape {self.joint_angles.shape}."
             )
             
-        # Simulating the calculation of an internal state hash
-        self._kinematics_hash = f"HASH_{sum(self.joint_angles)}"
+        # Simulating the calculation of an internal state hash.
+        # BLAKE2b (C implementation in the stdlib) over the raw float32 bytes: no string
+        # formatting, and no collisions between different angle sets with the same sum.
+        digest = hashlib.blake2b(self.joint_angles.tobytes(), digest_size=8).digest()
+        self._kinematics_hash = int.from_bytes(digest, "little")
+
+    def __eq__(self, other: object) -> bool:
+        """
+        The generated __eq__ would compare the arrays element-wise and fail
+        with an 'ambiguous truth value' error, so compare them explicitly.
+        """
+        if not isinstance(other, IndustrialRobotState):
+            return NotImplemented
+        return (self.axis_count == other.axis_count and
+                np.array_equal(self.joint_angles, other.joint_angles))
 
 
 if __name__ == "__main__":
@@ -77,6 +115,9 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Caught Exception: {type(e).__name__} - {e}")
 
+    trusted_packet = TelemetryPacket.from_trusted("NODE_A2", 26.1, time.time())
+    print(f"Created Trusted Packet: {trusted_packet}")
+
     print("\nAttempting to create packet with invalid physics:")
     try:
         bad_packet = TelemetryPacket(sensor_id="NODE_ERR", temperature=-300.0)
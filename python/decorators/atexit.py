@@ -1,17 +1,16 @@
 import atexit
-import functools
-from typing import Callable, Any, TypeVar, cast
+from typing import Callable, Any, TypeVar
 
 F = TypeVar('F', bound=Callable[..., Any])
 
 def run_at_exit(func: F) -> F:
-    """Registers the function in the atexit module for execution upon shutdown."""
+    """
+    Registers the function in the atexit module for execution upon shutdown.
+    The registration is the only effect, so the original function is returned
+    untouched: no wrapper means no extra call frame when it is called directly.
+    """
     atexit.register(func)
-    
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        return func(*args, **kwargs)
-    return cast(F, wrapper)
+    return func
 
 
 if __name__ == "__main__":
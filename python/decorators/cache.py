@@ -1,35 +1,88 @@
 
 import time
+import logging
 import functools
+import threading
+from collections import OrderedDict, deque
 from typing import Callable, Any, TypeVar, cast
 
+log = logging.getLogger(__name__)
+
 F = TypeVar('F', bound=Callable[..., Any])
 
-def cache_with_ttl(ttl_seconds: int = 60) -> Callable[[F], F]:
-    """Stores the result of the function for a specified time (TTL)."""
+def cache_with_ttl(ttl_seconds: int = 60, maxsize: int = 128) -> Callable[[F], F]:
+    """
+    Stores the result of the function for a specified time (TTL).
+    At most 'maxsize' results are kept in memory; when full, the least
+    recently used result is evicted first (LRU).
+    """
 
     def decorator(func: F) -> F:
-        cache: dict[str, tuple[Any, float]] = {} 
+        # Maps the hashable call key to (result, expiration deadline).
+        # The order of the keys tracks usage: oldest on the left, most recent on the right.
+        cache: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+
+        # (deadline, key) pairs in insertion order. Every entry shares the same TTL,
+        # so the deadlines are already sorted and the next one to expire is always on the left.
+        expirations: deque[tuple[float, Any]] = deque()
+
+        # Guards the bookkeeping above, as functools.lru_cache does: entries are
+        # deleted (expiry, LRU), so a lookup must not race another thread's sweep.
+        # The wrapped function itself runs outside the lock.
+        lock = threading.Lock()
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            cache_key = str(args) + str(kwargs)
-            
-            if cache_key in cache:
-                result, timestamp = cache[cache_key]
-                if time.time() - timestamp < ttl_seconds:
-                    print(f"[CACHE] Returning cached value to '{func.__name__}' (Validity: {ttl_seconds}s)")
-                    return result
-                else:
-                    print(f"[CACHE] Cache expired for '{func.__name__}'. Recalculating...")
+            # Same hashable key builder used internally by functools.lru_cache
+            cache_key = functools._make_key(args, kwargs, typed=False)
+
+            with lock:
+                # Monotonic clock: immune to wall-clock adjustments (NTP, manual changes)
+                now = time.monotonic()
+
+                # Lazily drop expired entries instead of waiting for the same call to happen again
+                while expirations and expirations[0][0] <= now:
+                    deadline, expired_key = expirations.popleft()
+                    entry = cache.get(expired_key)
+                    # Skip keys that were already evicted (LRU) or refreshed with a newer deadline
+                    if entry is not None and entry[1] == deadline:
+                        del cache[expired_key]
+                        log.debug("[CACHE] Cache expired for '%s'. Entry removed.", func.__name__)
+
+                entry = cache.get(cache_key)
+                if entry is not None:
+                    cache.move_to_end(cache_key)
+                    log.debug("[CACHE] Returning cached value to '%s' (Validity: %ss)", func.__name__, ttl_seconds)
+                    return entry[0]
 
             result = func(*args, **kwargs)
-            cache[cache_key] = (result, time.time())
+
+            with lock:
+                deadline = time.monotonic() + ttl_seconds
+                cache[cache_key] = (result, deadline)
+                cache.move_to_end(cache_key)
+                expirations.append((deadline, cache_key))
+
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+                # LRU evictions and refreshed keys leave stale pairs behind in the deque.
+                # Compact it once it grows past twice the cache size, so memory stays
+                # bounded by 'maxsize' (amortized O(1) per call).
+                if len(expirations) > 2 * maxsize:
+                    live = [
+                        (entry_deadline, key) for entry_deadline, key in expirations
+                        if (entry := cache.get(key)) is not None and entry[1] == entry_deadline
+                    ]
+                    expirations.clear()
+                    expirations.extend(live)
             return result
         return cast(F, wrapper)
     return decorator
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     @cache_with_ttl(ttl_seconds=5)
     def database_query(query: str) -> str:
         print("Consulting...")
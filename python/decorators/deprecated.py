@@ -1,15 +1,26 @@
+import warnings
 import functools
 from typing import Callable, Any, TypeVar, cast
 
 F = TypeVar('F', bound=Callable[..., Any])
 
 def deprecated(reason: str = "This feature will be removed in future versions") -> Callable[[F], F]:
-    """It issues a warning when the function is called."""
+    """
+    It issues a warning when the function is called.
+    Uses the warnings module instead of print(): the default filters only show
+    the warning once per call site, so hot loops don't pay for stdout I/O.
+    FutureWarning (not DeprecationWarning) is used because it is shown by
+    default from any module; DeprecationWarning is hidden unless the caller
+    is __main__.
+    """
 
     def decorator(func: F) -> F:
+        message = f"The function '{func.__name__}' is deprecated. Reason: {reason}"
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            print(f"\n[DEPRECATED] The function '{func.__name__}' is deprecated. Reason: {reason}\n",)
+            # stacklevel=2 points the warning at the caller, not at this wrapper
+            warnings.warn(message, FutureWarning, stacklevel=2)
     
             return func(*args, **kwargs)
         return cast(F, wrapper)
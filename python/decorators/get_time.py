@@ -1,7 +1,10 @@
 import time
+import logging
 import functools
 from typing import Callable, Any, TypeVar, cast
 
+log = logging.getLogger(__name__)
+
 F = TypeVar('F', bound=Callable[..., Any])
 
 def timer(func: F) -> F:
@@ -10,16 +13,19 @@ def timer(func: F) -> F:
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         
-        start_time = time.perf_counter()
+        # Integer nanoseconds: no float boxing per call and no precision drift
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.perf_counter()
+        end_ns = time.perf_counter_ns()
 
-        print(f"[TIMER] '{func.__name__}' executed in {end_time - start_time:.6f} seconds.")
+        log.debug("[TIMER] '%s' executed in %d µs.", func.__name__, (end_ns - start_ns) // 1000)
         
         return result
     return cast(F, wrapper)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     @timer
     def example_function(n: int) -> int:
         """Example function that sums numbers from 1 to n."""
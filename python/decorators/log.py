@@ -4,6 +4,8 @@ from typing import Callable, Any, TypeVar, cast
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+log = logging.getLogger(__name__)
+
 F = TypeVar('F', bound=Callable[..., Any])
 
 def logger(func: F) -> F:
@@ -11,14 +13,14 @@ def logger(func: F) -> F:
     
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        logging.info(f"Running '{func.__name__}' with args={args}, kwargs={kwargs}")
+        log.info("Running '%s' with args=%s, kwargs=%s", func.__name__, args, kwargs)
     
         try:
             result = func(*args, **kwargs)
-            logging.info(f"'{func.__name__}' returned: {result}")
+            log.info("'%s' returned: %s", func.__name__, result)
             return result
         except Exception as e:
-            logging.error(f"Error in '{func.__name__}': {e}")
+            log.error("Error in '%s': %s", func.__name__, e)
             raise
     
     return cast(F, wrapper)
@@ -1,27 +1,34 @@
 import time
+import logging
 import functools
 from typing import Callable, Any, TypeVar, cast
 
+log = logging.getLogger(__name__)
+
 F = TypeVar('F', bound=Callable[..., Any])
 
-def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,)) -> Callable[[F], F]:
+# Default exception filter: retry on any regular Exception
+_DEFAULT_EXCEPTIONS: tuple = (Exception,)
+
+def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = _DEFAULT_EXCEPTIONS) -> Callable[[F], F]:
     """ It attempts to execute the function again if a specific exception is raised. """
     
     def decorator(func: F) -> F:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            attempts = 0
-            
-            while attempts < max_attempts:
+            # Success path (the common case): returns on the first try
+            # without any counter bookkeeping or extra branches.
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    attempts += 1
-                    
-                    if attempts == max_attempts:
-                        print(f"[RETRY] Final failure in '{func.__name__}' after {max_attempts} attempts.")
+                    if attempt == max_attempts:
+                        log.error("[RETRY] Final failure in '%s' after %d attempts.", func.__name__, max_attempts)
                         raise
-                    print(f"[RETRY] Error in '{func.__name__}' ({e}). Attempt {attempts}/{max_attempts}. Waiting {delay}s...")
+                    log.warning(
+                        "[RETRY] Error in '%s' (%s). Attempt %d/%d. Waiting %ss...",
+                        func.__name__, e, attempt, max_attempts, delay
+                    )
                     time.sleep(delay)
 
         return cast(F, wrapper)
@@ -31,6 +38,8 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
 if __name__ == "__main__":
     import random
 
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
 
     @retry(max_attempts=2, delay=2, exceptions=(ValueError,))
     def unstable_function() -> str:
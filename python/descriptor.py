@@ -1,31 +1,43 @@
 import time
-from typing import Any
+from operator import attrgetter
 
 class BoundedInteger:
     """
-    A Data Descriptor that ensures an attribute is strictly an integer
+    A Descriptor that ensures an attribute is strictly an integer
     and falls within a specific minimum and maximum range.
+
+    Reads are the hot path (e.g., a control loop polling motor.pwm_signal),
+    so when the class is created the descriptor swaps itself for a property
+    whose getter is a C-level attrgetter. Reading never runs Python code;
+    only writes go through the validation below.
+
+    Note: reading the attribute before it was ever assigned no longer returns
+    None. It raises AttributeError naming the private storage ('_pwm_signal'
+    for 'pwm_signal'), since there is no Python getter to translate it.
     """
     def __init__(self, min_val: int, max_val: int):
         self.min_val = min_val
         self.max_val = max_val
         self.name = ""
+        self.private_name = ""
 
     def __set_name__(self, owner: type, name: str) -> None:
         # Called automatically in Python 3.6+ when the class is created.
         # It binds the descriptor to the name of the variable it was assigned to.
         self.name = name
+        # The validated value lives in a private attribute (e.g., '_pwm_signal'),
+        # which also works for owners that use __slots__ and have no __dict__.
+        self.private_name = f"_{name}"
 
-    def __get__(self, instance: object, owner: type) -> Any:
-        # If accessed from the class itself (not an instance), return the descriptor object
-        if instance is None:
-            return self
-        
-        # Retrieve the value directly from the instance's dictionary
-        return instance.__dict__.get(self.name)
+        setattr(owner, name, property(
+            fget=attrgetter(self.private_name),
+            fset=self._validate_and_store,
+            doc=f"Integer bounded to [{self.min_val}, {self.max_val}].",
+        ))
 
-    def __set__(self, instance: object, value: int) -> None:
-        if not isinstance(value, int):
+    def _validate_and_store(self, instance: object, value: int) -> None:
+        # 'type() is int' is a pointer comparison; isinstance() only runs for subclasses (e.g., bool)
+        if type(value) is not int and not isinstance(value, int):
             raise TypeError(f"Attribute '{self.name}' must be strictly an integer.")
         
         if not (self.min_val <= value <= self.max_val):
@@ -34,12 +46,16 @@ class BoundedInteger:
                 f"Got {value}, expected between {self.min_val} and {self.max_val}."
             )
         
-        # Store the validated value in the instance's dictionary
-        instance.__dict__[self.name] = value
+        # Store the validated value in the instance's private storage
+        setattr(instance, self.private_name, value)
 
 
 
 class MotorController:
+    # Storage for the BoundedInteger descriptors ('_' + attribute name).
+    # No per-instance __dict__ is created.
+    __slots__ = ("_pwm_signal", "_steering_angle")
+
     pwm_signal = BoundedInteger(min_val=0, max_val=255)
     steering_angle = BoundedInteger(min_val=-45, max_val=45)
 
@@ -1,11 +1,22 @@
-import math
-from typing import Union, List
+import sys
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Union
+
+import numpy as np # Requires: pip install numpy
+
+try:
+    from numba import njit # Optional: pip install numba (JIT compiler for numeric loops)
+except ImportError:
+    njit = None
 
 class RobotVector3D:
     """
     Represents a 3D coordinate or spatial vector in robotics.
     Demonstrates overloading arithmetic and comparison operators.
     """
+    # No per-instance __dict__: smaller objects and faster attribute access
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -33,15 +44,65 @@ class RobotVector3D:
         """
         Overloads the '==' operator.
         Crucial: Never use '==' directly for floats due to precision issues.
-        Use math.isclose instead.
+        Each axis must be within an absolute tolerance of 1e-5. A chained
+        comparison does this inline, without the three math.isclose() calls.
+        The '==' check first keeps equal infinities equal (inf - inf is nan).
         """
         if not isinstance(other, RobotVector3D):
             return False
             
-        tolerance = 1e-5
-        return (math.isclose(self.x, other.x, abs_tol=tolerance) and
-                math.isclose(self.y, other.y, abs_tol=tolerance) and
-                math.isclose(self.z, other.z, abs_tol=tolerance))
+        return ((self.x == other.x or -1e-5 <= self.x - other.x <= 1e-5) and
+                (self.y == other.y or -1e-5 <= self.y - other.y <= 1e-5) and
+                (self.z == other.z or -1e-5 <= self.z - other.z <= 1e-5))
+
+    def to_array(self) -> np.ndarray:
+        """Returns the vector as a (3,) float64 NumPy array."""
+        return np.array((self.x, self.y, self.z), dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> 'RobotVector3D':
+        """Builds a vector from any 3-element sequence or array."""
+        x, y, z = np.asarray(values, dtype=np.float64).tolist()
+        return cls(x, y, z)
+
+
+# =========================================================
+# BATCH API (Many vectors at once)
+# =========================================================
+# A single RobotVector3D stays backed by plain floats: for only 3 lanes, the
+# fixed cost of a NumPy ufunc call is higher than the math itself.
+# For bulk trajectory math, pack the vectors into one contiguous (N, 3) array
+# instead, so each operation is a single vectorized pass over all of them.
+
+def stack_vectors(vectors: Iterable[RobotVector3D]) -> np.ndarray:
+    """Packs N vectors into a contiguous (N, 3) float64 array."""
+    return np.array([(v.x, v.y, v.z) for v in vectors], dtype=np.float64).reshape(-1, 3)
+
+
+def unstack_vectors(points: np.ndarray) -> List[RobotVector3D]:
+    """Converts an (N, 3) array back into RobotVector3D objects."""
+    return [RobotVector3D(x, y, z) for x, y, z in points.tolist()]
+
+
+# Fused translate-then-scale, '(a + b) * s'. Written with the operators, the
+# sum is materialized first (an extra RobotVector3D, or an extra (N, 3) array
+# in batch code) and then read again to be scaled.
+
+def fused_translate_scale(a: RobotVector3D, b: RobotVector3D, s: float) -> RobotVector3D:
+    """Computes (a + b) * s, allocating only the result vector."""
+    return RobotVector3D((a.x + b.x) * s, (a.y + b.y) * s, (a.z + b.z) * s)
+
+
+def fused_translate_scale_batch(
+    points: np.ndarray, delta: np.ndarray, s: float, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Batch version over a float64 (N, 3) array. 'delta' is a (3,) offset or an (N, 3)
+    array of offsets. Both steps write into 'out' (allocated once when not
+    given, or the input itself for in-place updates), so no temporary is created.
+    """
+    out = np.add(points, delta, out=out)
+    return np.multiply(out, s, out=out)
 
 
 class PIDController:
@@ -51,6 +112,8 @@ class PIDController:
     but it retains internal state (like the accumulated integral error) 
     between calls without relying on global variables.
     """
+    __slots__ = ("kp", "ki", "kd", "_integral", "_previous_error")
+
     def __init__(self, kp: float, ki: float, kd: float):
         self.kp = kp
         self.ki = ki
@@ -64,17 +127,52 @@ class PIDController:
         This method is triggered when you use the object instance with parentheses ().
         Calculates the control output based on the error.
         """
-        p_term = self.kp * current_error
-        
-        self._integral += current_error * dt
-        i_term = self.ki * self._integral
-        
+        # Each attribute is read once into a local variable (cheaper than repeated self.* lookups)
+        integral = self._integral + current_error * dt
         derivative = (current_error - self._previous_error) / dt
-        d_term = self.kd * derivative
         
+        self._integral = integral
         self._previous_error = current_error
         
-        return p_term + i_term + d_term
+        return self.kp * current_error + self.ki * integral + self.kd * derivative
+
+    def process_batch(self, errors: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Runs the controller over a whole series of errors in one call
+        (e.g., simulating a step response or replaying logged data).
+        The state is carried over exactly as if __call__ was used for each sample.
+        """
+        errors = np.ascontiguousarray(errors, dtype=np.float64)
+        outputs = np.empty_like(errors)
+        
+        integral, previous_error = _pid_batch(
+            self.kp, self.ki, self.kd, self._integral, self._previous_error, errors, dt, outputs
+        )
+        # Without Numba the loop reads np.float64 items: store plain floats, so
+        # later __call__ results stay floats too
+        self._integral = float(integral)
+        self._previous_error = float(previous_error)
+        return outputs
+
+
+def _pid_batch(
+    kp: float, ki: float, kd: float,
+    integral: float, previous_error: float,
+    errors: np.ndarray, dt: float, outputs: np.ndarray
+) -> tuple:
+    """The PID loop over an array of errors. Writes into 'outputs' and returns the final state."""
+    for i in range(errors.shape[0]):
+        error = errors[i]
+        integral += error * dt
+        outputs[i] = kp * error + ki * integral + kd * (error - previous_error) / dt
+        previous_error = error
+    return integral, previous_error
+
+
+# Compiled to native code when Numba is available. This only pays off for batches:
+# for a single sample, converting the arguments costs more than the math itself.
+if njit is not None:
+    _pid_batch = njit(cache=True)(_pid_batch)
 
 
 class CircularSensorBuffer:
@@ -82,13 +180,15 @@ class CircularSensorBuffer:
     Acts just like a Python list, but keeps its memory footprint 
     capped by overwriting the oldest data when full (FIFO behavior).
     """
+    __slots__ = ("max_size", "_buffer")
+
     def __init__(self, max_size: int):
         self.max_size = max_size
-        self._buffer: List[float] = []
+        # A bounded deque drops the oldest element by itself in O(1).
+        # (list.pop(0) would shift every remaining element on each push: O(n))
+        self._buffer: Deque[float] = deque(maxlen=max_size)
 
     def push_data(self, value: float) -> None:
-        if len(self._buffer) >= self.max_size:
-            self._buffer.pop(0) # Remove the oldest element
         self._buffer.append(value)
 
     def __len__(self) -> int:
@@ -119,6 +219,13 @@ if __name__ == "__main__":
     # Testing float-safe equality
     pos_copy = RobotVector3D(30.0, 10.0000001, 12.5)
     print(f"Are pos_scaled and pos_copy equal? {pos_scaled == pos_copy}")
+    print(f"Vector instance size: {sys.getsizeof(pos_copy)} bytes (has __dict__? {hasattr(pos_copy, '__dict__')})")
+
+    # Batch math: one vectorized operation for the whole trajectory
+    trajectory = stack_vectors([pos_initial, pos_final, pos_scaled])
+    shifted = fused_translate_scale_batch(trajectory, movement.to_array(), 0.5)
+    print(f"Shifted trajectory: {unstack_vectors(shifted)}")
+    print(f"Fused (A + B) * 0.5: {fused_translate_scale(pos_initial, movement, 0.5)}")
 
 
     print("\n--- 2. Testing Callable Instances (PID Controller) ---")
@@ -133,6 +240,10 @@ if __name__ == "__main__":
     output_2 = heater_control(current_error=3.0, dt=1.0)
     print(f"Control Output (Cycle 2): {output_2:.2f}")
 
+    # Same controller, many samples in a single call
+    batch_outputs = heater_control.process_batch(np.array([2.0, 1.0, 0.5]), dt=1.0)
+    print(f"Control Output (Cycles 3-5): {np.round(batch_outputs, 2)}")
+
 
     print("\n--- 3. Testing Container Emulation ---")
     data_buffer = CircularSensorBuffer(max_size=3)
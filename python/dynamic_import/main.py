@@ -1,6 +1,49 @@
+import sys
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from registry import ACTIVE_DRIVERS
+from types import ModuleType
+from typing import Dict, Tuple
+from registry import snapshot
+
+# Already executed plugins: resolved file path -> (mtime in ns, module).
+# Rescanning the folder only re-executes files that are new or were modified.
+_PLUGIN_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
+
+def _load_one(py_file: Path) -> str:
+    """
+    Loads a single plugin file and returns a status line for the caller.
+    Runs inside a worker thread, so it must not print or touch shared
+    state other than the registry (which is lock-protected).
+    """
+    module_name = py_file.stem
+    cache_key = str(py_file.resolve())
+    mtime_ns = py_file.stat().st_mtime_ns
+
+    cached = _PLUGIN_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return f"  -> Module '{module_name}' unchanged. Skipping."
+    
+    # Prefixed name, so a plugin called e.g. 'time.py' can't shadow a real module
+    qualified_name = f"plugin_{module_name}"
+    spec = importlib.util.spec_from_file_location(qualified_name, py_file)
+    
+    if not (spec and spec.loader):
+        return f"  -> [FAILED] No loader found for module '{module_name}'."
+
+    module = importlib.util.module_from_spec(spec)
+    # Registered BEFORE executing, as importlib recommends: code inside the
+    # plugin (dataclasses, pickle, typing) may look itself up in sys.modules
+    sys.modules[qualified_name] = module
+    
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        del sys.modules[qualified_name]
+        return f"  -> [FAILED] Error loading module '{module_name}': {e}"
+
+    _PLUGIN_CACHE[cache_key] = (mtime_ns, module)
+    return f"  -> Module '{module_name}' loaded successfully."
 
 def load_plugins(directory: str) -> None:
     path = Path(directory)
@@ -11,33 +54,29 @@ def load_plugins(directory: str) -> None:
 
     print(f"[SYSTEM] Starting plugin scan in: {directory}/")
     
-    for py_file in path.glob("*.py"):
-        if py_file.name == "__init__.py":
-            continue
-            
-        module_name = py_file.stem
-        
-        spec = importlib.util.spec_from_file_location(module_name, py_file)
-        
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            
-            try:
-                spec.loader.exec_module(module)
-                print(f"  -> Module '{module_name}' loaded successfully.")
-            except Exception as e:
-                print(f"  -> [FAILED] Error loading module '{module_name}': {e}")
+    tasks = [py_file for py_file in path.glob("*.py") if py_file.name != "__init__.py"]
+
+    # Plugins are independent, so reading and compiling them can overlap
+    # (file I/O releases the GIL). map() keeps the results in file order,
+    # so the report below is printed in a stable order by the main thread.
+    with ThreadPoolExecutor() as executor:
+        for status in executor.map(_load_one, tasks):
+            print(status)
 
 if __name__ == "__main__":
     load_plugins("plugins")
+    load_plugins("plugins") # Second scan: every plugin is served from the cache
     
+    # Taken once after loading: the polling loop below never touches the dict
+    drivers = snapshot()
+
     print("\n[SYSTEM] Drivers registered and ready to use:")
-    for driver_name in ACTIVE_DRIVERS.keys():
+    for driver_name, _ in drivers:
         print(f" - {driver_name}")
         
     print("\n[SYSTEM] Requesting readings from all connected sensors:")
     
-    for name, reading_function in ACTIVE_DRIVERS.items():
+    for name, reading_function in drivers:
         try:
             data = reading_function()
             print(f"[{name}] Reading: {data['value']} {data['unit']}")
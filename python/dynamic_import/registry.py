@@ -1,14 +1,45 @@
-from typing import Callable, Dict
+import threading
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 
 
 ACTIVE_DRIVERS: Dict[str, Callable] = {}
 
+# Plugins may be loaded from several threads at once (see main.load_plugins)
+_REGISTRY_LOCK = threading.Lock()
+
+# Immutable copy of ACTIVE_DRIVERS for polling loops, rebuilt after a registration
+_SNAPSHOT: Optional[Tuple[Tuple[str, Callable], ...]] = None
+
+def register_sensor_direct(sensor_name: str, func: Callable) -> Callable:
+    """
+    Registers the driver function in the global dictionary.
+    Plugins can call it directly, without the decorator syntax.
+    """
+    global _SNAPSHOT
+    with _REGISTRY_LOCK:
+        ACTIVE_DRIVERS[sensor_name] = func
+        _SNAPSHOT = None
+    return func
+
 def register_sensor(sensor_name: str) -> Callable:
     """
     Decorator that registers the driver function in the global dictionary.
     It runs at the exact moment the module is loaded into memory.
+    The decorator is a functools.partial (a C object) instead of a nested
+    function, so no closure is built for every registered driver.
     """
-    def decorator(func: Callable) -> Callable:
-        ACTIVE_DRIVERS[sensor_name] = func
-        return func
-    return decorator
\ No newline at end of file
+    return partial(register_sensor_direct, sensor_name)
+
+def snapshot() -> Tuple[Tuple[str, Callable], ...]:
+    """
+    Returns the registered drivers as a tuple of (name, function) pairs.
+    Iterating a tuple skips the dict's hash table walk, and the tuple is
+    cached until a plugin (re)load registers a new driver.
+    """
+    global _SNAPSHOT
+    drivers = _SNAPSHOT
+    if drivers is None:
+        with _REGISTRY_LOCK:
+            drivers = _SNAPSHOT = tuple(ACTIVE_DRIVERS.items())
+    return drivers
\ No newline at end of file
@@ -27,6 +27,15 @@ class SystemFaultFlag(IntFlag):
     CRITICAL_HARDWARE_FAILURE = TEMP_HIGH | PRESSURE_LOW | VIBRATION_HIGH
 
 
+# Plain int masks for fault-polling loops. 'flag in status' and 'status & flag'
+# both run Python-level enum code ('&' even builds a new flag object), while
+# '&' between two ints is a single machine operation.
+TEMP_HIGH_MASK = int(SystemFaultFlag.TEMP_HIGH)
+PRESSURE_LOW_MASK = int(SystemFaultFlag.PRESSURE_LOW)
+VIBRATION_HIGH_MASK = int(SystemFaultFlag.VIBRATION_HIGH)
+NETWORK_LOSS_MASK = int(SystemFaultFlag.NETWORK_LOSS)
+
+
 class HardwareComponent(Enum):
     """
     Enums can have custom initialization, properties, and methods.
@@ -67,10 +76,13 @@ if __name__ == "__main__":
     print(f"Combined Status Value: {int(current_status)}") # Output will be 9 (1 + 8)
     print(f"Status Representation: {repr(current_status)}")
 
-    if SystemFaultFlag.TEMP_HIGH in current_status:
+    # Converted once per polling cycle, then tested with plain int masks
+    status_bits = int(current_status)
+
+    if status_bits & TEMP_HIGH_MASK:
         print(" -> ALARM: High temperature detected in the combined status!")
 
-    if SystemFaultFlag.VIBRATION_HIGH not in current_status:
+    if not status_bits & VIBRATION_HIGH_MASK:
         print(" -> OK: Vibration levels are normal.\n")
 
 
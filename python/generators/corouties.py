@@ -1,4 +1,5 @@
-from typing import Generator, Any
+from typing import Generator, Any, Tuple
+import numpy as np # Requires: pip install numpy
 
 def anomaly_filter(limit: float, next_step: Generator) -> Generator[None, float, None]:
     """
@@ -42,6 +43,19 @@ def start_coroutine(coro: Generator) -> Generator:
     next(coro)
     return coro
 
+def process_batch(values: np.ndarray, limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch version of the anomaly_filter -> media_movel pipeline.
+    Resuming a coroutine costs a Python frame switch per value; when the
+    readings already arrive as an array, the same result is computed with
+    a few vectorized NumPy calls instead.
+    Returns the kept values and the moving average after each of them.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    kept = values[values <= limit]
+    running_mean = np.cumsum(kept) / np.arange(1, kept.size + 1)
+    return kept, running_mean
+
 
 if __name__ == "__main__":
     average_calculator = start_coroutine(media_movel())
@@ -54,4 +68,9 @@ if __name__ == "__main__":
         filter_test.send(data)
 
     filter_test.close()
-    average_calculator.close()
\ No newline at end of file
+    average_calculator.close()
+
+    print("\n[BATCH] Same stream processed in a single call:")
+    kept, running_mean = process_batch(np.array(real_time_data), limit=28.0)
+    for value, media in zip(kept.tolist(), running_mean.tolist()):
+        print(f" ->Data processed: {value:.2f} | Current Moving Average: {media:.2f}")
\ No newline at end of file
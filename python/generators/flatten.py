@@ -2,14 +2,32 @@ from typing import Generator, Any
 
 def flatten_data_packets(packets: list) -> Generator[Any, None, None]:
     """
-    yield from' takes an iterable (like a list inside another list) 
-    and recursively delegates the yield to it. It avoids multiple nested 'for' loops.
+    Flattens arbitrarily nested lists lazily.
+    Instead of recursing with 'yield from' (one generator frame per nesting
+    level, and a RecursionError on very deep packets), it walks the tree
+    with an explicit stack of iterators inside a single generator.
+
+    Nesting is detected with 'type(item) is list' (a pointer comparison),
+    so list subclasses are treated as plain values: convert them with
+    list() when the packet is received.
     """
-    for item in packets:
-        if isinstance(item, list):
-            yield from flatten_data_packets(item)
-        else:
+    # Fast path: an already flat packet is passed through untouched.
+    # Only for real lists: scanning a generator/iterator would consume it.
+    if type(packets) is list and not any(type(item) is list for item in packets):
+        yield from packets
+        return
+
+    stack = [iter(packets)]
+    while stack:
+        for item in stack[-1]:
+            if type(item) is list:
+                # Descend: the current iterator keeps its position for later
+                stack.append(iter(item))
+                break
             yield item
+        else:
+            # The innermost list is exhausted, resume its parent
+            stack.pop()
 
 if __name__ == "__main__":
     dirty_packages = [24.5, [25.1, 26.0, [24.9, 25.5]], 23.8]
@@ -1,16 +1,26 @@
 from typing import Generator, Any
+import numpy as np # Requires: pip install numpy
+
+# Readings drawn from the RNG per batch
+READ_CHUNK = 1024
 
 def reads_generator(max_reads: int) -> Generator[float, None, None]:
     """
     Generates data on demand. Doesn't load everything into memory.
-    Excellent for reading large files or continuous streams.    """
-    import random
+    Excellent for reading large files or continuous streams.
+    The noise is drawn in chunks of READ_CHUNK values by NumPy (one C call),
+    but readings are still handed out one at a time as the consumer asks.
+    """
+    rng = np.random.default_rng()
+    remaining = max_reads
 
-    for i in range(max_reads):
+    while remaining > 0:
+        n = min(READ_CHUNK, remaining)
         # Simulates the reading of a temperature sensor with some noise.
-    
-        read = 25.0 + random.uniform(-2.0, 2.0)
-        yield round(read, 2)
+        reads = np.round(25.0 + rng.uniform(-2.0, 2.0, size=n), 2)
+        # tolist() hands back plain Python floats, as before
+        yield from reads.tolist()
+        remaining -= n
 
 if __name__ == "__main__":
     sensor = reads_generator(3)
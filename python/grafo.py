@@ -1,16 +1,25 @@
 import heapq
+from array import array
 from collections import deque
 from dataclasses import dataclass, field
-from typing import TypeVar, Generic, Dict, List, Set, Optional, Tuple
+from typing import TypeVar, Generic, Dict, List, Sequence, Set, Optional, Tuple
+
+import numpy as np # Requires: pip install numpy
+
+try:
+    from numba import njit # Optional: pip install numba (compiles the Dijkstra kernel)
+except ImportError:
+    njit = None
 
 T = TypeVar('T')
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node(Generic[T]):
     """
     An immutable generic node. 
     Frozen is strictly required so the node can be hashed and used 
     as a key in the Graph's adjacency dictionary.
+    slots=True removes the per-instance __dict__, which adds up on large graphs.
     """
     id: str
     payload: T
@@ -19,25 +28,51 @@ class Node(Generic[T]):
         return f"Node({self.id})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge(Generic[T]):
     """Represents a directional connection to another node with a cost."""
     destination: Node[T]
     weight: float = 1.0
 
 
+@dataclass(frozen=True, slots=True)
+class CSRGraph(Generic[T]):
+    """
+    Compressed Sparse Row (CSR) snapshot of a Graph.
+    Nodes become integer ids and all edges live in flat, contiguous arrays:
+    the outgoing edges of node 'u' are neighbors[indptr[u]:indptr[u + 1]]
+    (with the matching costs in weights[...]). Scanning neighbors becomes
+    a sequential read instead of chasing pointers to Edge objects.
+    """
+    node_index: Dict[Node[T], int]   # Node -> id
+    nodes_by_id: List[Node[T]]       # id -> Node
+    indptr: array                    # int32, size V + 1
+    neighbors: array                 # int32, size E
+    weights: array                   # float64, size E
+
+
 class Graph(Generic[T]):
     """
     A generic graph implemented via an Adjacency List.
     Memory efficient for sparse networks (like city maps or state machines).
+    Searches run on a CSR snapshot that is built on demand by finalize().
     """
     def __init__(self):
         # The core adjacency list: Maps a Node to a list of its outgoing Edges
         self._adjacency_list: Dict[Node[T], List[Edge[T]]] = {}
+        
+        # Cached CSR layout. Invalidated whenever the structure changes.
+        self._csr: Optional[CSRGraph[T]] = None
+
+        # Per-node scratch arrays for the compiled Dijkstra, sized by finalize()
+        # and reset in place on every query instead of being reallocated.
+        self._distance_buf: Optional[np.ndarray] = None
+        self._parent_buf: Optional[np.ndarray] = None
 
     def add_node(self, node: Node[T]) -> None:
         if node not in self._adjacency_list:
             self._adjacency_list[node] = []
+            self._csr = None
 
     def add_edge(self, src: Node[T], dest: Node[T], weight: float = 1.0, bidirectional: bool = True) -> None:
         """Connects two nodes. Adds them to the graph if they don't exist yet."""
@@ -47,6 +82,33 @@ class Graph(Generic[T]):
         self._adjacency_list[src].append(Edge(dest, weight))
         if bidirectional:
             self._adjacency_list[dest].append(Edge(src, weight))
+        self._csr = None
+
+    def finalize(self) -> CSRGraph[T]:
+        """
+        Builds (or returns the cached) CSR snapshot of the graph.
+        Call it once the edges are frozen; searches also call it automatically.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        nodes_by_id = list(self._adjacency_list)
+        node_index = {node: node_id for node_id, node in enumerate(nodes_by_id)}
+
+        indptr = array('i', [0])
+        neighbors = array('i')
+        weights = array('d')
+
+        for node in nodes_by_id:
+            for edge in self._adjacency_list[node]:
+                neighbors.append(node_index[edge.destination])
+                weights.append(edge.weight)
+            indptr.append(len(neighbors))
+
+        self._csr = CSRGraph(node_index, nodes_by_id, indptr, neighbors, weights)
+        self._distance_buf = np.full(len(nodes_by_id), np.inf, dtype=np.float64)
+        self._parent_buf = np.full(len(nodes_by_id), -1, dtype=np.int32)
+        return self._csr
 
     def _reconstruct_path(self, parent_map: Dict[Node[T], Node[T]], current: Node[T]) -> List[Node[T]]:
         """Backtracks from the target to the start using the parent map."""
@@ -57,31 +119,51 @@ class Graph(Generic[T]):
         path.reverse()
         return path
 
+    def _reconstruct_id_path(self, csr: CSRGraph[T], parent: Sequence[int], current: int) -> List[Node[T]]:
+        """Same as _reconstruct_path, but walks integer ids (-1 marks the start)."""
+        path = []
+        while current != -1:
+            path.append(csr.nodes_by_id[current])
+            current = parent[current]
+        path.reverse()
+        return path
+
     def bfs_shortest_path(self, start: Node[T], target: Node[T]) -> Optional[List[Node[T]]]:
         """
         Breadth-First Search (BFS).
         Guarantees the shortest path in an UNWEIGHTED graph.
         Uses a double-ended queue (deque) for O(1) pop operations.
         """
-        if start not in self._adjacency_list or target not in self._adjacency_list:
+        csr = self.finalize()
+        start_id = csr.node_index.get(start)
+        target_id = csr.node_index.get(target)
+        if start_id is None or target_id is None:
             return None
 
-        queue: deque[Node[T]] = deque([start])
-        visited: Set[Node[T]] = {start}
-        parent_map: Dict[Node[T], Node[T]] = {}
+        # Everything below works on plain integers: no Node hashing in the hot loop
+        indptr, neighbors = csr.indptr, csr.neighbors
+        node_count = len(csr.nodes_by_id)
+
+        # 1 byte per node for the visited mask and a packed C int per parent,
+        # instead of 8-byte pointers (or a hash set / dict of Node objects)
+        queue: deque[int] = deque([start_id])
+        visited = bytearray(node_count)
+        visited[start_id] = 1
+        parent = array('i', [-1]) * node_count
 
         while queue:
             # Pop from the left (FIFO)
             current = queue.popleft()
 
-            if current == target:
-                return self._reconstruct_path(parent_map, current)
+            if current == target_id:
+                return self._reconstruct_id_path(csr, parent, current)
 
-            for edge in self._adjacency_list[current]:
-                if edge.destination not in visited:
-                    visited.add(edge.destination)
-                    parent_map[edge.destination] = current
-                    queue.append(edge.destination)
+            for i in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = current
+                    queue.append(neighbor)
 
         return None # Target not reachable
 
@@ -121,44 +203,176 @@ class Graph(Generic[T]):
         Dijkstra's Algorithm.
         Finds the absolute shortest path in a WEIGHTED graph.
         Uses a Min-Heap (Priority Queue) to always expand the cheapest node first.
+        Runs as native code on the CSR snapshot when Numba is installed.
         """
-        if start not in self._adjacency_list or target not in self._adjacency_list:
+        if njit is not None:
+            return self._dijkstra_compiled(start, target)
+
+        csr = self.finalize()
+        start_id = csr.node_index.get(start)
+        target_id = csr.node_index.get(target)
+        if start_id is None or target_id is None:
             return None, float('inf')
 
-        # distances tracks the minimum cost to reach each node
-        distances: Dict[Node[T], float] = {node: float('inf') for node in self._adjacency_list}
-        distances[start] = 0.0
+        indptr, neighbors, weights = csr.indptr, csr.neighbors, csr.weights
+        node_count = len(csr.nodes_by_id)
+
+        # distances tracks the minimum cost to reach each node (indexed by node id).
+        # A list is kept here rather than the float64 buffer: reading a NumPy
+        # element from Python boxes a new float on every access.
+        distances: List[float] = [float('inf')] * node_count
+        distances[start_id] = 0.0
         
-        parent_map: Dict[Node[T], Node[T]] = {}
+        parent = array('i', [-1]) * node_count
         
-        # Priority Queue: stores tuples of (accumulated_cost, tie_breaker_id, Node)
-        # The tie_breaker ensures heapq doesn't try to compare Node objects if costs are equal
-        pq: List[Tuple[float, int, Node[T]]] = [(0.0, 0, start)]
-        tie_breaker = 0
+        # Priority Queue: stores (accumulated_cost, node_id) pairs.
+        # Ties on cost fall back to comparing two ints, so no tie-breaker counter is needed.
+        # Note: heapq has no decrease-key, so improved nodes are pushed again and stale
+        # entries are skipped when popped ("lazy deletion"). An indexed d-ary heap with
+        # decrease-key keeps the queue at O(V), but written in pure Python its sift loops
+        # run as bytecode and end up ~2x slower than heapq's C implementation.
+        pq: List[Tuple[float, int]] = [(0.0, start_id)]
 
         while pq:
-            current_cost, _, current_node = heapq.heappop(pq)
+            current_cost, current = heapq.heappop(pq)
 
-            if current_node == target:
-                return self._reconstruct_path(parent_map, current_node), current_cost
+            if current == target_id:
+                return self._reconstruct_id_path(csr, parent, current), current_cost
 
             # Optimization: Skip if we already found a cheaper path to this node 
             # while this particular tuple was waiting in the queue
-            if current_cost > distances[current_node]:
+            if current_cost > distances[current]:
                 continue
 
-            for edge in self._adjacency_list[current_node]:
-                new_cost = current_cost + edge.weight
+            for i in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[i]
+                new_cost = current_cost + weights[i]
 
-                if new_cost < distances[edge.destination]:
-                    distances[edge.destination] = new_cost
-                    parent_map[edge.destination] = current_node
-                    
-                    tie_breaker += 1
-                    heapq.heappush(pq, (new_cost, tie_breaker, edge.destination))
+                if new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heapq.heappush(pq, (new_cost, neighbor))
 
         return None, float('inf')
 
+    def _dijkstra_compiled(self, start: Node[T], target: Node[T]) -> Tuple[Optional[List[Node[T]]], float]:
+        """Prepares the CSR arrays, runs the compiled kernel and walks back the parents."""
+        csr = self.finalize()
+        start_id = csr.node_index.get(start)
+        target_id = csr.node_index.get(target)
+        if start_id is None or target_id is None:
+            return None, float('inf')
+
+        # Zero-copy NumPy views over the CSR buffers
+        indptr = np.frombuffer(csr.indptr, dtype=np.intc)
+        neighbors = np.frombuffer(csr.neighbors, dtype=np.intc)
+        weights = np.frombuffer(csr.weights, dtype=np.float64)
+
+        distances, parent = self._distance_buf, self._parent_buf
+        _dijkstra_csr_kernel(indptr, neighbors, weights, start_id, target_id, distances, parent)
+
+        total_cost = float(distances[target_id])
+        if total_cost == np.inf:
+            return None, total_cost
+        return self._reconstruct_id_path(csr, parent, target_id), total_cost
+
+
+# =========================================================
+# COMPILED DIJKSTRA KERNEL (CSR arrays only, no Python objects)
+# =========================================================
+# An indexed 4-ary min-heap of node ids ordered by 'dist'. 'pos[node]' is the node's
+# slot in the heap (-1: never queued, -2: already settled), which allows a real
+# decrease-key: the heap never holds more than V entries and needs no tie-breaker.
+
+def _heap_sift_up(heap: np.ndarray, pos: np.ndarray, dist: np.ndarray, i: int) -> None:
+    node = heap[i]
+    cost = dist[node]
+    while i > 0:
+        parent_slot = (i - 1) // 4
+        parent_node = heap[parent_slot]
+        if dist[parent_node] <= cost:
+            break
+        heap[i] = parent_node
+        pos[parent_node] = i
+        i = parent_slot
+    heap[i] = node
+    pos[node] = i
+
+
+def _heap_sift_down(heap: np.ndarray, pos: np.ndarray, dist: np.ndarray, i: int, size: int) -> None:
+    node = heap[i]
+    cost = dist[node]
+    while True:
+        first_child = 4 * i + 1
+        if first_child >= size:
+            break
+        best = first_child
+        best_cost = dist[heap[first_child]]
+        for child in range(first_child + 1, min(first_child + 4, size)):
+            child_cost = dist[heap[child]]
+            if child_cost < best_cost:
+                best = child
+                best_cost = child_cost
+        if best_cost >= cost:
+            break
+        heap[i] = heap[best]
+        pos[heap[i]] = i
+        i = best
+    heap[i] = node
+    pos[node] = i
+
+
+def _dijkstra_csr_kernel(
+    indptr: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, start: int, target: int,
+    dist: np.ndarray, parent: np.ndarray
+) -> None:
+    """
+    Fills the caller's 'dist' and 'parent' arrays (reset here, so they can be
+    reused across queries). Stops as soon as 'target' is settled.
+    """
+    node_count = indptr.shape[0] - 1
+    dist.fill(np.inf)
+    parent.fill(-1)
+    heap = np.empty(node_count, dtype=np.int32)
+    pos = np.full(node_count, -1, dtype=np.int32)
+
+    dist[start] = 0.0
+    heap[0] = start
+    pos[start] = 0
+    size = 1
+
+    while size > 0:
+        current = heap[0]
+        if current == target:
+            break
+
+        # Pop the cheapest node and mark it as settled
+        size -= 1
+        pos[current] = -2
+        if size > 0:
+            heap[0] = heap[size]
+            _heap_sift_down(heap, pos, dist, 0, size)
+
+        for i in range(indptr[current], indptr[current + 1]):
+            neighbor = neighbors[i]
+            if pos[neighbor] == -2:
+                continue
+            new_cost = dist[current] + weights[i]
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                parent[neighbor] = current
+                if pos[neighbor] == -1:
+                    heap[size] = neighbor
+                    pos[neighbor] = size
+                    size += 1
+                _heap_sift_up(heap, pos, dist, pos[neighbor])
+
+
+if njit is not None:
+    _heap_sift_up = njit(cache=True)(_heap_sift_up)
+    _heap_sift_down = njit(cache=True)(_heap_sift_down)
+    _dijkstra_csr_kernel = njit(cache=True)(_dijkstra_csr_kernel)
+
 
 if __name__ == "__main__":
     
@@ -1,11 +1,14 @@
-from typing import List, Any
+import threading
+from typing import Any, Sequence
+
+import numpy as np # Requires: pip install numpy
 
 class DataBufferIterator:
     """
     The dedicated Iterator. It only knows how to point to a specific 
     index in a given data source and move forward.
     """
-    def __init__(self, data_source: List[Any]):
+    def __init__(self, data_source: Sequence[Any]):
         self._data_source = data_source
         self._cursor = 0
 
@@ -25,19 +28,52 @@ class ThreadSafeSensorBuffer:
     """
     The Iterable container. It holds the data, but it DOES NOT track iteration state.
     Every time you call __iter__, it spawns a completely new, independent Iterator.
+
+    Readings are stored as raw doubles in a preallocated NumPy buffer that
+    doubles in size when full (8 bytes per reading, instead of a pointer
+    plus a boxed float object in a list).
     """
-    def __init__(self):
-        self._historical_data: List[float] = []
+    def __init__(self, capacity: int = 1024):
+        self._buffer = np.empty(capacity, dtype=np.float64)
+        # Writes go through a memoryview: storing a float into it is cheaper
+        # than NumPy's item assignment
+        self._view = memoryview(self._buffer)
+        self._size = 0
+        self._lock = threading.Lock()
 
     def add_reading(self, reading: float) -> None:
-        self._historical_data.append(reading)
+        with self._lock:
+            if self._size == len(self._view):
+                self._grow()
+            self._view[self._size] = reading
+            self._size += 1
+
+    def _grow(self) -> None:
+        """Doubles the capacity, copying the stored readings once."""
+        new_buffer = np.empty(max(1, 2 * self._buffer.size), dtype=np.float64)
+        new_buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = new_buffer
+        self._view = memoryview(new_buffer)
+
+    def asarray(self) -> np.ndarray:
+        """
+        Zero-copy NumPy view of the stored readings (for NumPy/Numba consumers).
+        It covers the readings at call time and stops tracking the buffer once
+        a later add_reading() has to grow it.
+        """
+        return self._buffer[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
 
     def __iter__(self) -> DataBufferIterator:
         """
         Returns a fresh iterator instance. This is the secret to allowing
         nested loops over the exact same object.
+        The iterator walks a memoryview of the readings stored so far,
+        which hands back plain Python floats.
         """
-        return DataBufferIterator(self._historical_data)
+        return DataBufferIterator(self._view[:self._size])
 
 
 if __name__ == "__main__":    
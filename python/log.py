@@ -78,9 +78,17 @@ class LogHardwareOperation:
         self.logger = HandleDebug().log
         self.start_time = 0.0
 
+        # Bound methods resolved once, so short operations logged in tight loops
+        # don't repeat the attribute lookups on every enter/exit
+        self._info = self.logger.info
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._perf_counter = time.perf_counter
+
     def __enter__(self) -> None:
-        self.start_time = time.perf_counter()
-        self.logger.info(f"▶️ [START] Hardware Operation: '{self.operation_name}' initiated.")
+        self.start_time = self._perf_counter()
+        # Lazy %-formatting: nothing is formatted when INFO is filtered out
+        if self._is_enabled_for(logging.INFO):
+            self._info("▶️ [START] Hardware Operation: '%s' initiated.", self.operation_name)
 
     def __exit__(
         self, 
@@ -89,17 +97,18 @@ class LogHardwareOperation:
         exc_tb: Optional[TracebackType]
     ) -> bool:
         
-        elapsed = time.perf_counter() - self.start_time
+        elapsed = self._perf_counter() - self.start_time
         
         if exc_type is not None:
-            self.logger.error(f"❌ [FAILED] Operation '{self.operation_name}' crashed after {elapsed:.2f}s!")
-            self.logger.exception(f"Exception details for '{self.operation_name}':")
+            # Failures are rare and always reported, so no fast path here
+            self.logger.error("❌ [FAILED] Operation '%s' crashed after %.2fs!", self.operation_name, elapsed)
+            self.logger.exception("Exception details for '%s':", self.operation_name)
             return False 
             
-        self.logger.info(f"⏹️ [SUCCESS] Operation '{self.operation_name}' completed safely in {elapsed:.2f}s.")
+        if self._is_enabled_for(logging.INFO):
+            self._info("⏹️ [SUCCESS] Operation '%s' completed safely in %.2fs.", self.operation_name, elapsed)
         return True
 
-
 if __name__ == "__main__":
     
     sys_logger_1 = HandleDebug()
@@ -1,21 +1,36 @@
+import logging
+import threading
 from typing import Any, Dict, Type
 
+log = logging.getLogger(__name__)
+
 class SingletonMeta(type):
     """
     A metaclass that restricts the instantiation of a class to one single object.
     Crucial for hardware interfaces (e.g., a serial port or a microcontroller) 
     where multiple concurrent instances would cause access collisions.
+
+    Thread-safe via double-checked locking: once the instance exists, every
+    call is a single lock-free dict lookup. The lock is only taken while the
+    instance is missing, and the check is repeated inside it so two threads
+    racing on the first call can't both run __init__. It is an RLock so a
+    singleton whose __init__ creates another singleton doesn't deadlock.
     """
     _instances: Dict[Type, Any] = {}
+    _lock = threading.RLock()
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-        if cls not in cls._instances:
-            print(f"[METACLASS] Creating the very first instance of {cls.__name__}")
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        else:
-            print(f"[METACLASS] Returning existing instance of {cls.__name__}")
-            
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                log.debug("[METACLASS] Creating the very first instance of %s", cls.__name__)
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+            return instance
 
 
 class SerialPortController(metaclass=SingletonMeta):
@@ -25,6 +40,8 @@ class SerialPortController(metaclass=SingletonMeta):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     port1 = SerialPortController()
     port2 = SerialPortController()
     port3 = SerialPortController()
@@ -1,6 +1,10 @@
 from typing import Any, Dict, Type
 
 
+# Methods every driver must define (checked with one set difference per class)
+_REQUIRED_METHODS = frozenset(("connect", "read_data"))
+
+
 class StrictDriverMeta(type):
     """
     Validates the structure of a class BEFORE it is created in memory.
@@ -9,11 +13,13 @@ class StrictDriverMeta(type):
     """
     def __new__(mcs, name: str, bases: tuple, namespace: dict) -> 'StrictDriverMeta':
         if name != "BaseDeviceDriver":
-            required_methods = ['connect', 'read_data']
-            
-            for method in required_methods:
-                if method not in namespace or not callable(namespace[method]):
-                    raise TypeError(f"[ARCHITECTURE ERROR] Class '{name}' is missing required method '{method}()'")
+            # Names that are absent, plus names bound to something that isn't callable
+            missing = _REQUIRED_METHODS.difference(namespace)
+            missing |= {m for m in _REQUIRED_METHODS - missing if not callable(namespace[m])}
+
+            if missing:
+                methods = ", ".join(f"'{method}()'" for method in sorted(missing))
+                raise TypeError(f"[ARCHITECTURE ERROR] Class '{name}' is missing required method {methods}")
         
         
         return super().__new__(mcs, name, bases, namespace)
@@ -1,80 +1,153 @@
-import multiprocessing
+import os
 import time
-import ctypes
-from typing import Any
-
-def process_sensor_chunk(
-    worker_id: int,
-    start_idx: int, 
-    end_idx: int, 
-    shared_array: Any, 
-    shared_counter: Any, 
-    lock: Any
-) -> None:
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Queue, shared_memory
+from typing import Any, Dict, Optional
+
+import numpy as np # Requires: pip install numpy
+
+try:
+    from numba import njit # Optional: pip install numba (compiles the chunk kernel)
+except ImportError:
+    njit = None
+
+
+# Sensor samples are stored as float32: the math needs no double precision, and
+# half the bytes per sample means half the memory traffic and twice the SIMD lanes.
+# The constants are float32 too, so neither NumPy nor Numba upcasts to float64.
+SENSOR_DTYPE = np.float32
+_SCALE = np.float32(3.14159)
+_EXPONENT = np.float32(1.5)
+
+
+def _sensor_chunk_kernel(chunk: np.ndarray) -> None:
+    """
+    The per-element math as a plain indexed loop. Compiled by Numba, the
+    multiply and the power are fused into a single pass over memory (the
+    NumPy version makes two). It stays single-threaded: the process pool
+    already runs one chunk per core.
+    """
+    for i in range(chunk.shape[0]):
+        chunk[i] = (chunk[i] * _SCALE) ** _EXPONENT
+
+
+if njit is not None:
+    _sensor_chunk_kernel = njit(fastmath=True, cache=True)(_sensor_chunk_kernel)
+
+# Per-process shared state, filled once by _init_worker when a Pool worker starts.
+# Tasks then only carry (worker_id, start_idx, end_idx) integers.
+_SHARED: Dict[str, Any] = {}
+
+def _init_worker(shm_name: str, array_size: int, cores: Optional[Queue]) -> None:
+    """
+    Pool initializer: runs once per worker process, not once per task.
+    Attaches to the shared memory block by name and builds the NumPy view
+    over it a single time; every chunk this worker processes is a slice of it.
+    It also pins the process to the core it takes from 'cores', so each
+    process keeps its own core for every chunk it picks up.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    # Keeping the handle referenced keeps the block mapped in this process
+    _SHARED["shm"] = shm
+    # Zero-copy NumPy array directly on the shared pages: no ctypes layer at all
+    _SHARED["array"] = np.ndarray((array_size,), dtype=SENSOR_DTYPE, buffer=shm.buf)
+    # Pin this process to its own core, so its chunks stay in that core's
+    # L1/L2 cache instead of migrating between cores mid-computation
+    if cores is not None:
+        try:
+            os.sched_setaffinity(0, {cores.get()})
+        except OSError:
+            pass # Pinning is only an optimization; keep the default scheduling
+
+def process_sensor_chunk(worker_id: int, start_idx: int, end_idx: int) -> int:
     """
     This function runs on a completely separate CPU core.
     It reads and writes directly to a shared block of C-level memory,
     bypassing the need to serialize (pickle) and copy data between processes.
     """
     print(f"[WORKER-{worker_id}] Starting heavy computation on indices {start_idx} to {end_idx - 1}...")
-    
-    # Simulating a heavy CPU-bound mathematical operation (e.g., matrix transformations)
-    for i in range(start_idx, end_idx):
-        # Reading from the shared C-array
-        raw_value = shared_array[i]
-        
-        # Heavy math simulation
-        processed_value = (raw_value * 3.14159) ** 1.5 
-        
-        # Writing directly back to the shared memory block
-        shared_array[i] = processed_value
+
+    chunk = _SHARED["array"][start_idx:end_idx]
+
+    # Simulating a heavy CPU-bound mathematical operation (e.g., matrix transformations).
+    if njit is not None:
+        _sensor_chunk_kernel(chunk)
+    else:
+        # Each ufunc runs as one C loop over the chunk and writes straight back
+        # into the shared memory block (out=chunk), without temporary arrays.
+        # Not tiled into L1-sized blocks on purpose: np.power is compute-bound
+        # (~80% of the time), so the extra memory pass of the multiply is cheap,
+        # while the per-block ufunc calls cost more than they save. The Numba
+        # kernel above is the fused single-pass version.
+        np.multiply(chunk, _SCALE, out=chunk)
+        np.power(chunk, _EXPONENT, out=chunk)
         
-    # Safely updating a shared variable. 
-    # Without the lock, two workers might update it at the exact same millisecond, 
-    # causing a race condition where 1 + 1 = 1.
-    with lock:
-        shared_counter.value += 1
-        print(f"[WORKER-{worker_id}] Finished. Total chunks completed globally: {shared_counter.value}")
+    # No shared counter to update: a counter written by several processes needs a
+    # lock (or two workers might update it at the exact same millisecond, causing
+    # a race condition where 1 + 1 = 1). Returning the id lets the parent,
+    # the only writer, do the counting instead.
+    return worker_id
+
 
 
 if __name__ == "__main__":
 
     ARRAY_SIZE = 100
     print(f"[SYSTEM] Allocating shared memory array of size {ARRAY_SIZE}...")
-    shared_sensor_data = multiprocessing.Array(ctypes.c_double, ARRAY_SIZE)
+    # A raw shared memory block (no lock, no ctypes wrapper) used directly as the
+    # buffer of a NumPy array. Workers write disjoint chunks, so nothing here
+    # needs a lock.
+    shm = shared_memory.SharedMemory(create=True, size=ARRAY_SIZE * np.dtype(SENSOR_DTYPE).itemsize)
+    sensor_data = np.ndarray((ARRAY_SIZE,), dtype=SENSOR_DTYPE, buffer=shm.buf)
     
-    for i in range(ARRAY_SIZE):
-        shared_sensor_data[i] = float(i)
+    # Filled in one vectorized copy, not element by element
+    sensor_data[:] = np.arange(ARRAY_SIZE, dtype=SENSOR_DTYPE)
 
-    tasks_completed = multiprocessing.Value(ctypes.c_int, 0)
-    
-    memory_lock = multiprocessing.Lock()
+    tasks_completed = 0
 
     # Let's split the 100 elements into 4 chunks of 25 to run on 4 separate cores.
     NUM_WORKERS = 4
     chunk_size = ARRAY_SIZE // NUM_WORKERS
-    processes: list[multiprocessing.Process] = []
+    tasks = [(i, i * chunk_size, (i + 1) * chunk_size) for i in range(NUM_WORKERS)]
 
-    start_time = time.perf_counter()
+    # One core id per pool process, handed out by the initializer, so no two
+    # processes share a core while another one idles.
+    # (sched_setaffinity only exists on Linux)
+    cores = None
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        cores = Queue()
+        for i in range(NUM_WORKERS):
+            cores.put(cpus[i % len(cpus)])
 
-    for i in range(NUM_WORKERS):
-        start_index = i * chunk_size
-        end_index = start_index + chunk_size
-        
-        p = multiprocessing.Process(
-            target=process_sensor_chunk,
-            args=(i, start_index, end_index, shared_sensor_data, tasks_completed, memory_lock)
-        )
-        processes.append(p)
-        p.start() 
+    start_time = time.perf_counter()
 
-    print(f"[SYSTEM] Dispatched {NUM_WORKERS} concurrent processes.")
+    try:
+        # Workers attach to the block once, by name, through the initializer.
+        # The executor's workers are reused, so later batches of chunks don't pay
+        # process start-up again.
+        with ProcessPoolExecutor(
+            max_workers=NUM_WORKERS,
+            initializer=_init_worker,
+            initargs=(shm.name, ARRAY_SIZE, cores),
+        ) as executor:
+            print(f"[SYSTEM] Dispatching {len(tasks)} chunks to a pool of {NUM_WORKERS} processes.")
+            # Each task only carries three ints; every chunk is queued up front
+            futures = [executor.submit(process_sensor_chunk, *task) for task in tasks]
 
-    # The main script must wait for all child processes to finish before continuing.
-    for p in processes:
-        p.join()
+            # Results are handled as each chunk finishes, in completion order
+            for future in as_completed(futures):
+                worker_id = future.result()
+                tasks_completed += 1
+                print(f"[WORKER-{worker_id}] Finished. Total chunks completed globally: {tasks_completed}")
 
-    elapsed_time = time.perf_counter() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
-    print(f"\n[SYSTEM] All processes completed in {elapsed_time:.4f} seconds.")
-    print(f"[SYSTEM] Shared Counter Value: {tasks_completed.value}")
\ No newline at end of file
+        print(f"\n[SYSTEM] All processes completed in {elapsed_time:.4f} seconds.")
+        print(f"[SYSTEM] Completed Chunks: {tasks_completed}")
+    finally:
+        # The block outlives the processes that use it: release it explicitly.
+        # The NumPy view must go first, it holds a pointer into the mapping.
+        del sensor_data
+        shm.close()
+        shm.unlink()
\ No newline at end of file
@@ -1,27 +1,47 @@
-import time
-from enum import Enum, auto
-from abc import ABC, abstractmethod
+import logging
+import threading
+from enum import IntEnum, auto
 from dataclasses import dataclass
-from typing import Dict, Type, Optional, Any
+from typing import Callable, Dict, List, Tuple, Type, Optional, Any
 
-class Trigger(Enum):
-    """Events that force the machine to change its state."""
+log = logging.getLogger(__name__)
+
+class Trigger(IntEnum):
+    """
+    Events that force the machine to change its state.
+    IntEnum members hash and compare as plain ints (in C), which makes the
+    routing-table lookups cheaper than with Enum's Python-level __hash__.
+    """
     START_PROCESS = auto()
     OVERHEAT_DETECTED = auto()
     COOLING_FINISHED = auto()
     FINISH_PROCESS = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class HardwareContext:
-    """The central memory that all states can read and modify."""
+    """
+    The central memory that all states can read and modify.
+    slots=True: fields live in fixed slots instead of a per-instance __dict__,
+    which makes the reads/writes states do on every tick (e.g. temperature) cheaper.
+    """
     device_name: str
     temperature: float = 25.0
     is_active: bool = False
 
 
-class BaseState(ABC):
-    """Contract that forces every state to have these specific methods."""
+class BaseState:
+    """
+    Contract that every state follows.
+    A plain class instead of an ABC: states are only created once, inside the
+    machine, so a missing execute() surfaces as NotImplementedError on the
+    first tick. __slots__ means state instances carry no __dict__.
+    """
+    __slots__ = ('wait_tick',)
+
+    def __init__(self, wait_tick: Callable[[float], None]):
+        # The owning machine's tick wait, handed over once when it creates the state
+        self.wait_tick = wait_tick
     
     def on_enter(self, context: HardwareContext) -> None:
         """Called exactly once when the state begins."""
@@ -31,35 +51,38 @@ class BaseState(ABC):
         """Called exactly once when the state ends."""
         pass
 
-    @abstractmethod
     def execute(self, context: HardwareContext) -> Optional[Trigger]:
         """Core logic loop. Returns a Trigger to change state, or None to stay."""
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
 
 
 # =========================================================
 # STATES (The Business Logic)
 # =========================================================
 class IdleState(BaseState):
+    __slots__ = ()
+
     def on_enter(self, context: HardwareContext) -> None:
-        print(f"\n[{context.device_name}] Entering IDLE Mode.")
+        log.info("\n[%s] Entering IDLE Mode.", context.device_name)
         context.is_active = False
 
     def execute(self, context: HardwareContext) -> Optional[Trigger]:
-        print(" -> Waiting for work...")
-        time.sleep(0.5)
+        log.debug(" -> Waiting for work...")
+        self.wait_tick(0.5)
         return Trigger.START_PROCESS
 
 
 class WorkingState(BaseState):
+    __slots__ = ()
+
     def on_enter(self, context: HardwareContext) -> None:
-        print(f"\n[{context.device_name}] Entering WORKING Mode.")
+        log.info("\n[%s] Entering WORKING Mode.", context.device_name)
         context.is_active = True
 
     def execute(self, context: HardwareContext) -> Optional[Trigger]:
         context.temperature += 20.0
-        print(f" -> Processing... Temperature rising to {context.temperature}C")
-        time.sleep(0.5)
+        log.debug(" -> Processing... Temperature rising to %sC", context.temperature)
+        self.wait_tick(0.5)
         
         if context.temperature >= 65.0:
             return Trigger.OVERHEAT_DETECTED
@@ -68,14 +91,16 @@ class WorkingState(BaseState):
 
 
 class FaultState(BaseState):
+    __slots__ = ()
+
     def on_enter(self, context: HardwareContext) -> None:
-        print(f"\n[{context.device_name}] ALARM! OVERHEAT DETECTED. Shutting down actuators.")
+        log.warning("\n[%s] ALARM! OVERHEAT DETECTED. Shutting down actuators.", context.device_name)
         context.is_active = False # Safe state enforced
 
     def execute(self, context: HardwareContext) -> Optional[Trigger]:
         context.temperature -= 20.0
-        print(f" -> Cooling down... Current temp: {context.temperature}C")
-        time.sleep(0.5)
+        log.debug(" -> Cooling down... Current temp: %sC", context.temperature)
+        self.wait_tick(0.5)
         
         if context.temperature <= 25.0:
             return Trigger.COOLING_FINISHED
@@ -93,58 +118,95 @@ class SynchronousStateMachine:
     """
     def __init__(self, context: HardwareContext):
         self.context = context
-        self.current_state: BaseState = IdleState()
+        # Set by wake() to end the current tick early
+        self._tick_event = threading.Event()
+
+        # States keep no data of their own (everything lives in HardwareContext),
+        # so one instance per state is created here and reused on every transition.
+        # Each state is identified by its position in this tuple (IDLE=0, WORKING=1, FAULT=2).
+        state_classes = (IdleState, WorkingState, FaultState)
+        self._states: List[BaseState] = [state_class(self.wait_tick) for state_class in state_classes]
         
-        # The routing table: CurrentState -> {Trigger -> NextState}
-        self.transitions: Dict[Type[BaseState], Dict[Trigger, Type[BaseState]]] = {
-            IdleState: {
-                Trigger.START_PROCESS: WorkingState
-            },
-            WorkingState: {
-                Trigger.OVERHEAT_DETECTED: FaultState,
-                Trigger.FINISH_PROCESS: IdleState
-            },
-            FaultState: {
-                Trigger.COOLING_FINISHED: IdleState
-            }
+        # The routing table: (CurrentState, Trigger) -> NextState.
+        # Only read here, to build _routes below.
+        transitions: Dict[Tuple[Type[BaseState], Trigger], Type[BaseState]] = {
+            (IdleState, Trigger.START_PROCESS): WorkingState,
+            (WorkingState, Trigger.OVERHEAT_DETECTED): FaultState,
+            (WorkingState, Trigger.FINISH_PROCESS): IdleState,
+            (FaultState, Trigger.COOLING_FINISHED): IdleState,
         }
 
+        # The same table compiled to integer ids: _routes[state_id] maps
+        # Trigger -> next state_id. An event is resolved with a list index and
+        # one dict lookup, without calling type() or building a key tuple.
+        state_ids = {state_class: state_id for state_id, state_class in enumerate(state_classes)}
+        self._routes: List[Dict[Trigger, int]] = [{} for _ in state_classes]
+        for (source, trigger), target in transitions.items():
+            self._routes[state_ids[source]][trigger] = state_ids[target]
+
+        self._state_id = state_ids[IdleState]
+
+        # Dispatch table specialized for this machine: the bound execute() of each
+        # state, resolved once. A tick is then one list index and one call.
+        self._executes: List[Callable[[HardwareContext], Optional[Trigger]]] = [
+            state.execute for state in self._states
+        ]
+
+    @property
+    def current_state(self) -> BaseState:
+        """The active state, derived from _state_id so the two can't drift apart."""
+        return self._states[self._state_id]
+
     def __enter__(self) -> 'SynchronousStateMachine':
         """Safely boots the hardware when entering the 'with' block."""
-        print("=== SYSTEM BOOT ===")
+        log.info("=== SYSTEM BOOT ===")
         self.current_state.on_enter(self.context)
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Guarantees safe shutdown even if the script crashes."""
-        print("\n=== SYSTEM SHUTDOWN ===")
+        log.info("\n=== SYSTEM SHUTDOWN ===")
         self.current_state.on_exit(self.context)
         self.context.is_active = False
-        print("[SAFETY] Hardware locked securely.")
+        log.info("[SAFETY] Hardware locked securely.")
+
+    def wait_tick(self, period: float) -> None:
+        """
+        Waits for the next tick: 'period' seconds, or less if someone calls
+        wake(). Unlike time.sleep, the machine reacts to external events at once.
+        """
+        if self._tick_event.wait(period):
+            self._tick_event.clear()
+
+    def wake(self) -> None:
+        """Ends the current tick immediately (safe to call from any thread)."""
+        self._tick_event.set()
 
     def trigger_transition(self, trigger: Trigger) -> None:
-        """Looks up the routing table and swaps the active state class."""
-        state_class = type(self.current_state)
-        allowed_transitions = self.transitions.get(state_class, {})
+        """Looks up the routing table and swaps the active state."""
+        next_state_id = self._routes[self._state_id].get(trigger)
         
-        if trigger in allowed_transitions:
-            next_state_class = allowed_transitions[trigger]
-            
+        if next_state_id is not None:
             self.current_state.on_exit(self.context)
-            self.current_state = next_state_class()
+            self._state_id = next_state_id
             self.current_state.on_enter(self.context)
         else:
-            print(f"[ERROR] Invalid trigger {trigger.name} for {state_class.__name__}")
+            log.error("[ERROR] Invalid trigger %s for %s", trigger.name, type(self.current_state).__name__)
 
     def __call__(self, max_ticks: int) -> None:
         """Executes the machine using the instance as a function."""
+        executes = self._executes
+        context = self.context
         for _ in range(max_ticks):
-            trigger = self.current_state.execute(self.context)
-            if trigger:
+            trigger = executes[self._state_id](context)
+            if trigger is not None:
                 self.trigger_transition(trigger)
 
 
 if __name__ == "__main__":
+    # Per-tick messages are DEBUG: raise the level to INFO to keep only state changes
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     shared_memory = HardwareContext(device_name="ROBOT_ARM_ALPHA")
     
     with SynchronousStateMachine(shared_memory) as fsm:        